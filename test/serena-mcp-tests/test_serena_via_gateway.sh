@@ -28,6 +28,9 @@ TEMP_DIR="/tmp/serena-gateway-test-$$"
 GATEWAY_PORT=18080
 GATEWAY_API_KEY="test-api-key-$$"
 GATEWAY_CONTAINER_NAME="serena-gateway-test-$$"
+# Upper bound in seconds for a single MCP request, so a stalled gateway or
+# backend fails the request instead of hanging the whole suite
+MCP_REQUEST_TIMEOUT="${MCP_REQUEST_TIMEOUT:-120}"
 
 # Test counters
 TESTS_PASSED=0
@@ -73,7 +76,12 @@ cleanup() {
     if [ -n "$GATEWAY_PID" ] && kill -0 "$GATEWAY_PID" 2>/dev/null; then
         log_info "Stopping gateway process (PID: $GATEWAY_PID)..."
         kill "$GATEWAY_PID" 2>/dev/null || true
-        sleep 2
+        # Wait up to 2 seconds for a graceful exit, polling rather than
+        # sleeping the full period
+        for _ in 1 2 3 4 5 6 7 8 9 10; do
+            kill -0 "$GATEWAY_PID" 2>/dev/null || break
+            sleep 0.2
+        done
         # Force kill if still running
         kill -9 "$GATEWAY_PID" 2>/dev/null || true
     fi
@@ -139,8 +147,12 @@ fi
 # Test 4: Pull Serena container image
 log_section "Test 4: Serena Container Image Availability"
 count_test
-log_info "Pulling Serena container image..."
-if docker pull "$SERENA_IMAGE" >/dev/null 2>&1; then
+# Check if image exists locally first
+if docker image inspect "$SERENA_IMAGE" >/dev/null 2>&1; then
+    log_info "Using local Serena image (skipping pull)"
+    log_success "Serena container image is available"
+elif docker pull "$SERENA_IMAGE" >/dev/null 2>&1; then
+    log_info "Pulled Serena container image"
     log_success "Serena container image is available"
 else
     log_error "Failed to pull Serena container image: $SERENA_IMAGE"
@@ -194,44 +206,43 @@ cat "$TEMP_DIR/gateway-config.json" | docker run --rm -i \
 GATEWAY_PID=$!
 
 # Wait for gateway to be ready
-log_info "Waiting for gateway to be ready (PID: $GATEWAY_PID)..."
-sleep 5
-
-# Check if process is still running
-if ! kill -0 $GATEWAY_PID 2>/dev/null; then
-    log_error "Gateway process died unexpectedly"
-    log_info "Gateway logs:"
-    cat "$TEMP_DIR/gateway.log"
-    exit 1
-fi
-
-# Wait for gateway to fully initialize (Serena backend takes ~20-25 seconds to start)
-log_info "Waiting for Serena backend initialization (this may take 20-30 seconds)..."
-sleep 25
-
-# Check if process is still running after backend init
-if ! kill -0 $GATEWAY_PID 2>/dev/null; then
-    log_error "Gateway process died during initialization"
-    log_info "Gateway logs:"
-    cat "$TEMP_DIR/gateway.log"
-    exit 1
-fi
-
-# Check if gateway is responding with retries
-log_info "Testing gateway connection..."
+# The initialize response is the readiness signal: poll it with exponential
+# backoff instead of sleeping for a fixed period. The Serena backend can take
+# 20-30 seconds to start, so the overall budget stays well above that.
+log_info "Waiting for gateway and Serena backend to be ready (PID: $GATEWAY_PID)..."
+READY_TIMEOUT="${GATEWAY_READY_TIMEOUT:-60}"
+READY_DEADLINE=$((SECONDS + READY_TIMEOUT))
+READY_DELAY=1
 GATEWAY_TEST="0"
-for i in 1 2 3 4 5; do
-    GATEWAY_TEST=$(curl -s -X POST "http://localhost:$GATEWAY_PORT/mcp/serena" \
+while :; do
+    # Check if process is still running
+    if ! kill -0 $GATEWAY_PID 2>/dev/null; then
+        log_error "Gateway process died during initialization"
+        log_info "Gateway logs:"
+        cat "$TEMP_DIR/gateway.log"
+        exit 1
+    fi
+
+    READY_REMAINING=$((READY_DEADLINE - SECONDS))
+    if [ $READY_REMAINING -lt 1 ]; then
+        READY_REMAINING=1
+    fi
+    if curl -s --max-time "$READY_REMAINING" -X POST "http://localhost:$GATEWAY_PORT/mcp/serena" \
         -H "Content-Type: application/json" \
+        -H "Accept: application/json, text/event-stream" \
         -H "Authorization: $GATEWAY_API_KEY" \
         -d '{"jsonrpc":"2.0","id":1,"method":"initialize","params":{"protocolVersion":"2024-11-05","capabilities":{},"clientInfo":{"name":"test","version":"1.0"}}}' \
-        2>/dev/null | grep -c '"jsonrpc"' || echo "0")
-    
-    if [ "$GATEWAY_TEST" != "0" ]; then
+        2>/dev/null | grep -q '"result"'; then
+        GATEWAY_TEST="1"
         break
     fi
-    log_info "Retry $i/5..."
-    sleep 3
+    if [ $SECONDS -ge $READY_DEADLINE ]; then
+        break
+    fi
+    sleep $READY_DELAY
+    if [ $READY_DELAY -lt 4 ]; then
+        READY_DELAY=$((READY_DELAY * 2))
+    fi
 done
 
 if [ "$GATEWAY_TEST" != "0" ]; then
@@ -266,7 +277,7 @@ send_mcp_request_direct() {
     
     # Run curl and save response to file
     if [ -n "$session_id" ]; then
-        curl -s -X POST "$endpoint" \
+        curl -s --max-time "$MCP_REQUEST_TIMEOUT" -X POST "$endpoint" \
             -H "Content-Type: application/json" \
             -H "Accept: application/json, text/event-stream" \
             -H "Authorization: $GATEWAY_API_KEY" \
@@ -274,7 +285,7 @@ send_mcp_request_direct() {
             -D "$headers_file" \
             -d "$request" > "$MCP_RESPONSE_FILE" 2>/dev/null || echo '{"error": "request failed"}' > "$MCP_RESPONSE_FILE"
     else
-        curl -s -X POST "$endpoint" \
+        curl -s --max-time "$MCP_REQUEST_TIMEOUT" -X POST "$endpoint" \
             -H "Content-Type: application/json" \
             -H "Accept: application/json, text/event-stream" \
             -H "Authorization: $GATEWAY_API_KEY" \
@@ -298,16 +309,15 @@ get_mcp_response() {
 }
 
 # Function to get parsed JSON from SSE response
+# Reads the response file directly rather than copying it through shell variables
 get_mcp_response_json() {
-    local raw_response=$(cat "$MCP_RESPONSE_FILE")
-    
     # Check if response is SSE format
-    if echo "$raw_response" | grep -q "^event: message"; then
-        # Extract JSON from "data: {...}" line
-        echo "$raw_response" | grep "^data: " | sed 's/^data: //' | tail -1
+    if grep -q "^event: message" "$MCP_RESPONSE_FILE" 2>/dev/null; then
+        # Extract JSON from the last "data: {...}" line
+        sed -n 's/^data: //p' "$MCP_RESPONSE_FILE" | tail -1
     else
         # Already JSON
-        echo "$raw_response"
+        cat "$MCP_RESPONSE_FILE"
     fi
 }
 